@@ -6,6 +6,7 @@ tkinterdnd2 (drag & drop) are used only if importable.
 """
 
 import os
+import queue
 import sys
 import threading
 import tkinter as tk
@@ -25,21 +26,6 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 import splitpay_core as core
 
-try:
-    import ttkbootstrap as tb
-
-    HAS_TTKB = True
-except Exception:
-    HAS_TTKB = False
-
-try:
-    from tkinterdnd2 import DND_FILES, TkinterDnD
-
-    HAS_DND = True
-except Exception:
-    HAS_DND = False
-
-
 THEMES_LIGHT_DEFAULT = "flatly"
 THEMES_DARK_DEFAULT = "darkly"
 
@@ -96,14 +82,33 @@ def show_help_dialog(parent, title: str, text: str):
 # -------------------- GUI --------------------
 
 
+def load_optional_gui_modules():
+    """Import the optional extras, returning ``(ttkbootstrap, tkinterdnd2)``.
+
+    Either is None if not importable. Done when the GUI starts rather than at
+    import time: split worker processes re-import this module ("spawn") and
+    would otherwise pay for ttkbootstrap (~0.1 s) without ever using it.
+    """
+    try:
+        import ttkbootstrap as tb
+    except Exception:
+        tb = None
+    try:
+        import tkinterdnd2 as dnd
+    except Exception:
+        dnd = None
+    return tb, dnd
+
+
 def run_gui():
     cfg = core.load_config()
+    tb, dnd = load_optional_gui_modules()
 
     default_width = cfg.get("window_width", 940)
     default_height = cfg.get("window_height", 620)
 
-    if HAS_DND:
-        root = TkinterDnD.Tk()
+    if dnd is not None:
+        root = dnd.TkinterDnD.Tk()
     else:
         root = tk.Tk()
 
@@ -111,7 +116,7 @@ def run_gui():
         THEMES_DARK_DEFAULT if cfg.get("dark_mode", False) else THEMES_LIGHT_DEFAULT
     )
     style = None
-    if HAS_TTKB:
+    if tb is not None:
         try:
             style = tb.Style(theme=initial_theme)
         except Exception:
@@ -139,8 +144,40 @@ def run_gui():
     root.geometry(f"{w}x{h}+{x}+{y}")
 
     # ---- thread-safe UI helper: schedule any call onto the main thread ----
+    # Workers report every page, so calls are queued and run in order by one
+    # Tk timer rather than registering an after() callback per call.
+    ui_calls = queue.SimpleQueue()
+
     def ui(fn, *args, **kwargs):
-        root.after(0, lambda: fn(*args, **kwargs))
+        ui_calls.put((fn, args, kwargs))
+
+    def drain_ui_calls():
+        # Re-arm first: a call may open a modal dialog (nested event loop) and
+        # the calls queued behind it should still run while it is shown.
+        root.after(100, drain_ui_calls)
+        while True:
+            try:
+                fn, args, kwargs = ui_calls.get_nowait()
+            except queue.Empty:
+                break
+            fn(*args, **kwargs)
+        flush_log_lines()
+
+    root.after(100, drain_ui_calls)
+
+    # ---- config writes are coalesced: callers update cfg and schedule one
+    # save 500 ms later, so a burst of toggles/clicks writes the file once ----
+    config_save = {"after_id": None}
+
+    def flush_config():
+        if config_save["after_id"] is not None:
+            root.after_cancel(config_save["after_id"])
+            config_save["after_id"] = None
+        core.save_config(cfg)
+
+    def schedule_config_save():
+        if config_save["after_id"] is None:
+            config_save["after_id"] = root.after(500, flush_config)
 
     # ---------------- Menu bar (Help ▸ About) ----------------
     def show_about():
@@ -188,7 +225,7 @@ def run_gui():
                 style.theme_use(name)
                 cfg["dark_mode"] = dark_mode.get()
                 cfg["theme"] = name
-                core.save_config(cfg)
+                schedule_config_save()
             except Exception:
                 pass
 
@@ -312,19 +349,56 @@ def run_gui():
     log_tab = ttk.Frame(bottom)
     bottom.add(log_tab, text="Log")
     log_tab.columnconfigure(0, weight=1)
-    log_box = scrolledtext.ScrolledText(log_tab, wrap=tk.WORD, height=7)
+    log_box = scrolledtext.ScrolledText(
+        log_tab, wrap=tk.WORD, height=7, undo=False, maxundo=0
+    )
     log_box.grid(row=0, column=0, sticky="nsew")
 
+    # Lines are collected and written to the log box once per drain tick, so
+    # a split logging every page costs one Text insert per 100 ms, not one
+    # per line. The box keeps the newest LOG_MAX_LINES; the app log file has
+    # everything.
+    LOG_MAX_LINES = 5000
+    log_pending = []
+
     def append_log(msg: str):
-        log_box.insert(tk.END, f"{datetime.now().strftime('%H:%M:%S')}  {msg}\n")
-        log_box.see(tk.END)
+        log_pending.append(f"{datetime.now().strftime('%H:%M:%S')}  {msg}\n")
         core.write_app_log(msg)
 
+    def flush_log_lines():
+        if not log_pending:
+            return
+        text = "".join(log_pending)
+        log_pending.clear()
+        log_box.insert(tk.END, text)
+        # Text ends with "\n", so the line at end-1c is the empty one after it.
+        last = int(log_box.index("end-1c").split(".")[0])
+        if last - 1 > LOG_MAX_LINES:
+            log_box.delete("1.0", f"{last - LOG_MAX_LINES}.0")
+        log_box.see(tk.END)
+
     def update_progress(cur: int, total: int, noun: str = "page"):
         progress["maximum"] = total
         progress["value"] = cur
         status_var.set(f"Processing {noun} {cur} of {total}")
 
+    # Label + entry + Browse on one grid row; pick is "file" (a PDF) or "dir".
+    def path_row(parent, row, label, var, pick, width=None, pady=2):
+        def ask():
+            if pick == "file":
+                return filedialog.askopenfilename(filetypes=[("PDF files", "*.pdf")])
+            return filedialog.askdirectory()
+
+        ttk.Label(parent, text=label).grid(
+            row=row, column=0, sticky="w", padx=4, pady=pady
+        )
+        ttk.Entry(parent, textvariable=var, width=width).grid(
+            row=row, column=1, sticky="ew", padx=4, pady=pady
+        )
+        ttk.Button(
+            parent, text="Browse", command=lambda: var.set(ask() or var.get())
+        ).grid(row=row, column=2, padx=4, pady=pady)
+
     # ============ TAB 1: Payroll Splitter ============
     tab_pay = ttk.Frame(notebook)
     notebook.add(tab_pay, text="Payroll Splitter")
@@ -332,36 +406,10 @@ def run_gui():
     for c in range(3):
         tab_pay.columnconfigure(c, weight=1 if c == 1 else 0)
 
-    ttk.Label(tab_pay, text="1 · Input PDF").grid(
-        row=0, column=0, sticky="w", padx=4, pady=(6, 2)
-    )
     pay_in = tk.StringVar(value=cfg.get("last_input", ""))
-    ttk.Entry(tab_pay, textvariable=pay_in, width=70).grid(
-        row=0, column=1, sticky="ew", padx=4, pady=(6, 2)
-    )
-    ttk.Button(
-        tab_pay,
-        text="Browse",
-        command=lambda: pay_in.set(
-            filedialog.askopenfilename(filetypes=[("PDF files", "*.pdf")])
-            or pay_in.get()
-        ),
-    ).grid(row=0, column=2, padx=4, pady=(6, 2))
-
-    ttk.Label(tab_pay, text="2 · Output folder").grid(
-        row=1, column=0, sticky="w", padx=4, pady=2
-    )
+    path_row(tab_pay, 0, "1 · Input PDF", pay_in, "file", width=70, pady=(6, 2))
     pay_out = tk.StringVar(value=cfg.get("last_output", ""))
-    ttk.Entry(tab_pay, textvariable=pay_out, width=70).grid(
-        row=1, column=1, sticky="ew", padx=4, pady=2
-    )
-    ttk.Button(
-        tab_pay,
-        text="Browse",
-        command=lambda: pay_out.set(
-            filedialog.askdirectory() or pay_out.get()
-        ),
-    ).grid(row=1, column=2, padx=4, pady=2)
+    path_row(tab_pay, 1, "2 · Output folder", pay_out, "dir", width=70)
 
     auto_open = tk.BooleanVar(value=cfg.get("auto_open", True))
     save_to_folders = tk.BooleanVar(value=cfg.get("save_to_folders", True))
@@ -438,7 +486,7 @@ def run_gui():
         selected_schema.set(name)
         schema_combo.set(name)
         cfg["last_schema"] = name
-        core.save_config(cfg)
+        schedule_config_save()
         messagebox.showinfo("Saved", f"Schema '{name}' saved.")
 
     def do_remove_schema():
@@ -454,7 +502,7 @@ def run_gui():
         selected_schema.set("None")
         schema_combo.set("None")
         cfg["last_schema"] = "None"
-        core.save_config(cfg)
+        schedule_config_save()
         messagebox.showinfo("Removed", f"Schema '{name}' removed.")
 
     save_btn = ttk.Button(schema_frame, text="💾 Save", command=do_save_schema)
@@ -512,7 +560,7 @@ def run_gui():
         save_btn.config(state="disabled" if locked else "normal")
         remove_btn.config(state="disabled" if locked else "normal")
         cfg["pattern_locked"] = locked
-        core.save_config(cfg)
+        schedule_config_save()
 
     lock_cb = ttk.Checkbutton(
         schema_frame,
@@ -896,7 +944,7 @@ def run_gui():
         cfg["file_pattern"] = file_pattern_var.get()
         cfg["folder_pattern"] = folder_pattern_var.get()
         cfg["last_schema"] = selected_schema.get()
-        core.save_config(cfg)
+        schedule_config_save()
 
         file_pat = file_pattern_var.get()
         folder_pat = folder_pattern_var.get()
@@ -957,6 +1005,9 @@ def run_gui():
                     log_callback=lambda m: ui(append_log, m),
                     progress_callback=lambda p, t: ui(update_progress, p, t),
                     cancel_event=cancel_event,
+                    # A preview writes nothing, so it isn't worth starting
+                    # worker processes for; real splits use the pool.
+                    max_workers=1 if debug_safe.get() else None,
                 )
                 ui(finish_split, res)
             except core.PdfError as e:
@@ -1005,34 +1056,8 @@ def run_gui():
     ext_per_page = tk.BooleanVar(value=cfg.get("ext_per_page", False))
     tools_auto_open = tk.BooleanVar(value=cfg.get("tools_auto_open", True))
 
-    ttk.Label(extract_frame, text="Input PDF:").grid(
-        row=0, column=0, sticky="w", padx=4, pady=2
-    )
-    ttk.Entry(extract_frame, textvariable=tools_ext_in).grid(
-        row=0, column=1, sticky="ew", padx=4, pady=2
-    )
-    ttk.Button(
-        extract_frame,
-        text="Browse",
-        command=lambda: tools_ext_in.set(
-            filedialog.askopenfilename(filetypes=[("PDF files", "*.pdf")])
-            or tools_ext_in.get()
-        ),
-    ).grid(row=0, column=2, padx=4, pady=2)
-
-    ttk.Label(extract_frame, text="Output folder:").grid(
-        row=1, column=0, sticky="w", padx=4, pady=2
-    )
-    ttk.Entry(extract_frame, textvariable=tools_ext_out).grid(
-        row=1, column=1, sticky="ew", padx=4, pady=2
-    )
-    ttk.Button(
-        extract_frame,
-        text="Browse",
-        command=lambda: tools_ext_out.set(
-            filedialog.askdirectory() or tools_ext_out.get()
-        ),
-    ).grid(row=1, column=2, padx=4, pady=2)
+    path_row(extract_frame, 0, "Input PDF:", tools_ext_in, "file")
+    path_row(extract_frame, 1, "Output folder:", tools_ext_out, "dir")
 
     ttk.Label(extract_frame, text="Single page:").grid(
         row=2, column=0, sticky="w", padx=4, pady=2
@@ -1069,6 +1094,14 @@ def run_gui():
         if not inp or not os.path.isfile(inp):
             messagebox.showerror("Error", "Select a valid input PDF.")
             return
+        single = ext_single_page.get().strip()
+        r_from = ext_range_from.get().strip()
+        r_to = ext_range_to.get().strip()
+        try:
+            page_indices, single_page = core.parse_pages(single, r_from, r_to)
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
         out_dir = tools_ext_out.get().strip()
         if not out_dir:
             out_dir = os.path.dirname(inp)
@@ -1078,21 +1111,17 @@ def run_gui():
         cfg["tools_ext_out"] = out_dir
         cfg["ext_per_page"] = ext_per_page.get()
         cfg["tools_auto_open"] = tools_auto_open.get()
-        core.save_config(cfg)
-
-        single = ext_single_page.get().strip()
-        r_from = ext_range_from.get().strip()
-        r_to = ext_range_to.get().strip()
+        schedule_config_save()
 
         append_log(f"▶ Extract from: {inp}")
         append_log(f"Output: {out_dir}")
         if single:
             append_log(f"Single page: {single}")
-        if r_from and r_to:
+        elif r_from and r_to:
             append_log(f"Range: {r_from}–{r_to}")
         append_log(f"Per-page: {ext_per_page.get()}")
 
-        cancelable = ext_per_page.get() and bool(r_from and r_to)
+        cancelable = ext_per_page.get() and len(page_indices) > 1
         cancel_event.clear()
         set_busy(True, cancelable=cancelable)
 
@@ -1101,9 +1130,8 @@ def run_gui():
                 core.extract_pages(
                     inp_path=inp,
                     out_dir=out_dir,
-                    single_page=single,
-                    range_from=r_from,
-                    range_to=r_to,
+                    page_indices=page_indices,
+                    single_page=single_page,
                     per_page=ext_per_page.get(),
                     auto_open=tools_auto_open.get(),
                     log_callback=lambda m: ui(append_log, m),
@@ -1152,13 +1180,16 @@ def run_gui():
 
     def refresh_merge_listbox(select_index=None):
         merge_listbox.delete(0, tk.END)
-        for p in tools_merge_files:
-            merge_listbox.insert(tk.END, os.path.basename(p))
+        # One Tcl call for the whole list rather than one per file.
+        merge_listbox.insert(tk.END, *(os.path.basename(p) for p in tools_merge_files))
         if select_index is not None and 0 <= select_index < len(tools_merge_files):
-            merge_listbox.selection_clear(0, tk.END)
-            merge_listbox.selection_set(select_index)
-            merge_listbox.activate(select_index)
-            merge_listbox.see(select_index)
+            select_merge_row(select_index)
+
+    def select_merge_row(index):
+        merge_listbox.selection_clear(0, tk.END)
+        merge_listbox.selection_set(index)
+        merge_listbox.activate(index)
+        merge_listbox.see(index)
 
     def merge_selected_index():
         sel = merge_listbox.curselection()
@@ -1170,8 +1201,10 @@ def run_gui():
         if not paths:
             return
         # Append (don't replace) so users can build up a list from several picks.
+        # Only the new rows are inserted; the existing ones are left alone.
         tools_merge_files = tools_merge_files + list(paths)
-        refresh_merge_listbox(len(tools_merge_files) - 1)
+        merge_listbox.insert(tk.END, *(os.path.basename(p) for p in paths))
+        select_merge_row(len(tools_merge_files) - 1)
         if not tools_merge_out.get():
             tools_merge_out.set(os.path.dirname(tools_merge_files[0]))
 
@@ -1218,19 +1251,7 @@ def run_gui():
         side="left", padx=(6, 0)
     )
 
-    ttk.Label(merge_frame, text="Output folder:").grid(
-        row=3, column=0, sticky="w", padx=4, pady=2
-    )
-    ttk.Entry(merge_frame, textvariable=tools_merge_out).grid(
-        row=3, column=1, sticky="ew", padx=4, pady=2
-    )
-    ttk.Button(
-        merge_frame,
-        text="Browse",
-        command=lambda: tools_merge_out.set(
-            filedialog.askdirectory() or tools_merge_out.get()
-        ),
-    ).grid(row=3, column=2, padx=4, pady=2)
+    path_row(merge_frame, 3, "Output folder:", tools_merge_out, "dir")
 
     ttk.Label(merge_frame, text="Output filename (optional):").grid(
         row=4, column=0, sticky="w", padx=4, pady=2
@@ -1257,7 +1278,7 @@ def run_gui():
         cfg["tools_merge_out"] = out_dir
         cfg["merge_name"] = merge_name_var.get()
         cfg["tools_auto_open"] = tools_auto_open.get()
-        core.save_config(cfg)
+        schedule_config_save()
 
         append_log(f"▶ Merge {len(tools_merge_files)} PDFs")
         append_log(f"Output folder: {out_dir}")
@@ -1296,7 +1317,7 @@ def run_gui():
     action_buttons.append(merge_btn)
 
     # ---------------- Drag & drop (optional) ----------------
-    if HAS_DND:
+    if dnd is not None:
         def on_drop(event):
             try:
                 items = root.tk.splitlist(event.data)
@@ -1313,7 +1334,7 @@ def run_gui():
                 append_log(f"📥 Dropped PDF → Extract input: {pdfs[0]}")
 
         try:
-            root.drop_target_register(DND_FILES)
+            root.drop_target_register(dnd.DND_FILES)
             root.dnd_bind("<<Drop>>", on_drop)
         except Exception:
             pass
@@ -1323,9 +1344,10 @@ def run_gui():
         try:
             cfg["window_width"] = root.winfo_width()
             cfg["window_height"] = root.winfo_height()
-            core.save_config(cfg)
+            flush_config()
         except Exception:
             pass
+        core.close_app_log()
         root.destroy()
 
     root.protocol("WM_DELETE_WINDOW", on_close)
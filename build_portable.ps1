@@ -18,7 +18,7 @@
       5. pip-install requirements.txt into the bundle (pip runs on the
          build machine only, never on the target machine).
       6. Copy the app, launcher and docs; create data\ and logs\.
-      7. Smoke-test the bundled runtime (import fitz, pandas, tkinter).
+      7. Smoke-test the bundled runtime (import fitz, tkinter, ttkbootstrap, tkinterdnd2).
 
 .EXAMPLE
     powershell -ExecutionPolicy Bypass -File .\build_portable.ps1
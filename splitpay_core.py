@@ -4,12 +4,18 @@ Config/appdata handling, filename/folder naming patterns, schema storage,
 and the PDF operations (split, extract, merge). No tkinter imports here.
 """
 
+import atexit
 import csv
+import functools
 import json
+import multiprocessing
 import os
 import re
 import subprocess
 import sys
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from datetime import datetime
 
 import fitz  # PyMuPDF
@@ -57,31 +63,90 @@ def load_config():
 
 
 def save_config(cfg):
+    # Write to a temp file and swap it in, so a crash or full disk mid-write
+    # leaves the previous config intact instead of a truncated JSON file.
+    tmp_path = CONFIG_FILE + ".tmp"
     try:
-        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
+        with open(tmp_path, "w", encoding="utf-8") as f:
             json.dump(cfg, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, CONFIG_FILE)
     except Exception:
-        pass
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+# The app log is kept open (buffered) for the life of the process: a split
+# logs every page, and an open/close per line is slow on Windows, where
+# antivirus hooks every file open.
+APP_LOG_FLUSH_EVERY = 100
+
+_app_log_lock = threading.Lock()
+_app_log_file = None
+_app_log_pending = 0
 
 
 def write_app_log(line: str):
+    global _app_log_file, _app_log_pending
     ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    try:
-        with open(APP_LOG_PATH, "a", encoding="utf-8") as f:
-            f.write(f"[{ts}] {line}\n")
-    except Exception:
-        pass
+    with _app_log_lock:
+        try:
+            if _app_log_file is None:
+                _app_log_file = open(APP_LOG_PATH, "a", encoding="utf-8")
+            _app_log_file.write(f"[{ts}] {line}\n")
+            _app_log_pending += 1
+            # Errors are flushed straight away so they survive a crash.
+            if (
+                _app_log_pending >= APP_LOG_FLUSH_EVERY
+                or "❌" in line
+                or "error" in line.lower()
+            ):
+                _app_log_file.flush()
+                _app_log_pending = 0
+        except Exception:
+            pass
+
+
+def flush_app_log():
+    global _app_log_pending
+    with _app_log_lock:
+        try:
+            if _app_log_file is not None:
+                _app_log_file.flush()
+        except Exception:
+            pass
+        _app_log_pending = 0
+
+
+def close_app_log():
+    global _app_log_file, _app_log_pending
+    with _app_log_lock:
+        try:
+            if _app_log_file is not None:
+                _app_log_file.close()
+        except Exception:
+            pass
+        _app_log_file = None
+        _app_log_pending = 0
+
+
+atexit.register(close_app_log)
 
 
 # -------------------- Utilities --------------------
 
 
+_SANITIZE_RE = re.compile(r"[^\w\s-]")
+
+
 def sanitize_filename(name: str) -> str:
-    return re.sub(r"[^\w\s-]", "", name).strip().replace(" ", "_")
+    return _SANITIZE_RE.sub("", name).strip().replace(" ", "_")
 
 
-def normalize_folder_name(name: str) -> str:
-    repl = {
+# Croatian diacritics folded to ASCII in one C-level pass (str.translate).
+_FOLDER_TRANS = str.maketrans(
+    {
         "č": "c",
         "ć": "c",
         "ž": "z",
@@ -93,10 +158,12 @@ def normalize_folder_name(name: str) -> str:
         "Š": "s",
         "Đ": "d",
     }
-    for k, v in repl.items():
-        name = name.replace(k, v)
-    name = re.sub(r"[^\w]", "", name)
-    return name.lower()
+)
+_FOLDER_STRIP_RE = re.compile(r"[^\w]")
+
+
+def normalize_folder_name(name: str) -> str:
+    return _FOLDER_STRIP_RE.sub("", name.translate(_FOLDER_TRANS)).lower()
 
 
 def get_schema_folder():
@@ -106,8 +173,12 @@ def get_schema_folder():
 
 
 def list_schemas():
-    schema_dir = get_schema_folder()
-    return [f[:-5] for f in os.listdir(schema_dir) if f.endswith(".json")]
+    with os.scandir(get_schema_folder()) as entries:
+        return [
+            e.name[:-5]
+            for e in entries
+            if e.name.endswith(".json") and e.is_file()
+        ]
 
 
 def _read_schema_file(path):
@@ -128,11 +199,27 @@ def _read_schema_file(path):
         return None
 
 
+# Parsed schemas keyed by path -> ((mtime_ns, size), data). Selecting a schema
+# and then running with it would otherwise parse the same file twice.
+_schema_cache = {}
+
+
 def load_schema(name):
     path = os.path.join(get_schema_folder(), f"{name}.json")
-    if not os.path.exists(path):
+    try:
+        st = os.stat(path)
+    except OSError:
         return None
-    return _read_schema_file(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    hit = _schema_cache.get(path)
+    if hit is not None and hit[0] == stamp:
+        return dict(hit[1])
+    data = _read_schema_file(path)
+    if data is not None:
+        _schema_cache[path] = (stamp, data)
+        return dict(data)
+    _schema_cache.pop(path, None)
+    return None
 
 
 def save_schema(name, file_pattern, folder_pattern):
@@ -140,6 +227,7 @@ def save_schema(name, file_pattern, folder_pattern):
         return
     schema_dir = get_schema_folder()
     path = os.path.join(schema_dir, f"{name}.json")
+    _schema_cache.pop(path, None)
     with open(path, "w", encoding="utf-8") as f:
         json.dump(
             {
@@ -157,6 +245,7 @@ def delete_schema(name):
     if not name or name == "None":
         return
     path = os.path.join(get_schema_folder(), f"{name}.json")
+    _schema_cache.pop(path, None)
     if os.path.exists(path):
         os.remove(path)
 
@@ -174,8 +263,51 @@ def get_unique_auditlog_path(outdir: str) -> str:
         counter += 1
 
 
-def get_unique_path(base_path: str) -> str:
-    """Return a unique filesystem path by adding _1, _2,... if needed."""
+def _taken_names(directory: str, used_names: dict) -> set:
+    """Names (normcased) already present in ``directory``, listed only once.
+
+    ``used_names`` maps directory -> set and is filled lazily, so a run does a
+    single readdir per output folder instead of a stat() per candidate name.
+    """
+    taken = used_names.get(directory)
+    if taken is None:
+        try:
+            taken = {os.path.normcase(n) for n in os.listdir(directory)}
+        except OSError:
+            taken = set()
+        used_names[directory] = taken
+    return taken
+
+
+def reserve_unique_name(directory: str, filename: str, used_names: dict) -> str:
+    """Return a free name for ``filename`` in directory (adds _1, _2,...).
+
+    The name is recorded in ``used_names`` (see _taken_names) — split pages are
+    written by background workers, so a name can be taken before its file
+    exists on disk. Comparison uses os.path.normcase, matching Windows'
+    case-insensitive filesystem.
+    """
+    taken = _taken_names(directory, used_names)
+    base, ext = os.path.splitext(filename)
+    final_name = filename
+    counter = 1
+    while os.path.normcase(final_name) in taken:
+        final_name = f"{base}_{counter}{ext}"
+        counter += 1
+    taken.add(os.path.normcase(final_name))
+    return final_name
+
+
+def get_unique_path(base_path: str, used_names=None) -> str:
+    """Return a unique filesystem path by adding _1, _2,... if needed.
+
+    Pass the same ``used_names`` dict across calls that write into one folder
+    to list it once rather than probing the disk for every candidate.
+    """
+    if used_names is not None:
+        directory, name = os.path.split(base_path)
+        final_name = reserve_unique_name(directory, name, used_names)
+        return os.path.join(directory, final_name)
     if not os.path.exists(base_path):
         return base_path
     root, ext = os.path.splitext(base_path)
@@ -198,13 +330,53 @@ def write_audit_csv(path: str, rows):
         writer.writerows(rows)
 
 
+class AuditCsvWriter:
+    """Append audit rows to a CSV as a run produces them.
+
+    Same format as write_audit_csv. The file is only created when the first
+    row arrives, so a run that produces no rows leaves no CSV behind.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.rows_written = 0
+        self._file = None
+        self._writer = None
+
+    def writerow(self, row):
+        if self._file is None:
+            self._file = open(self.path, "w", newline="", encoding="utf-8-sig")
+            self._writer = csv.DictWriter(self._file, fieldnames=AUDIT_FIELDS)
+            self._writer.writeheader()
+        self._writer.writerow(row)
+        self.rows_written += 1
+
+    def flush(self):
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
 def open_folder(path: str, log=None):
     try:
         if os.name == "nt":
-            subprocess.Popen(["explorer", os.path.realpath(path)])
+            # ShellExecute directly — no explorer.exe child process to spawn.
+            os.startfile(os.path.realpath(path))
         else:
             opener = "open" if sys.platform == "darwin" else "xdg-open"
-            subprocess.Popen([opener, path])
+            # Detached and silent: the worker doesn't wait on the file
+            # manager, and its chatter doesn't land on our console.
+            subprocess.Popen(
+                [opener, path],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
     except Exception as e:
         if log:
             log(f"⚠ Failed to auto-open folder: {e}")
@@ -222,6 +394,30 @@ def open_folder(path: str, log=None):
 LINE_TOKEN_RE = re.compile(r"\[LINE\s+(\d+)(?:\((\d+)(?:/(\d+))?\))?\]")
 
 
+@functools.lru_cache(maxsize=64)
+def _parse_pattern(pattern: str):
+    """Split a pattern into literal strings and ``(line_no, start, stop)`` tokens.
+
+    ``start``/``stop`` are ready-to-use slice bounds (0-based start, exclusive
+    stop) or None. Patterns are parsed once and cached — a split run expands
+    the same two patterns for every page.
+    """
+    parts = []
+    pos = 0
+    for match in LINE_TOKEN_RE.finditer(pattern):
+        if match.start() > pos:
+            parts.append(pattern[pos:match.start()])
+        start_pos = match.group(2)
+        end_pos = match.group(3)
+        start = max(int(start_pos) - 1, 0) if start_pos else None
+        stop = int(end_pos) if start_pos and end_pos else None
+        parts.append((int(match.group(1)), start, stop))
+        pos = match.end()
+    if pos < len(pattern):
+        parts.append(pattern[pos:])
+    return tuple(parts)
+
+
 def _resolve_line_pattern(lines, pattern: str):
     """Substitute [LINE ...] tokens in ``pattern``.
 
@@ -232,30 +428,22 @@ def _resolve_line_pattern(lines, pattern: str):
     "a real value was extracted" and "only literal separators remain".
     """
     resolved = 0
-
-    def replace_token(match):
-        nonlocal resolved
-        line_no = int(match.group(1))
-        start_pos = match.group(2)
-        end_pos = match.group(3)
-
-        if line_no < 0 or line_no >= len(lines):
-            return ""
-
+    out = []
+    for part in _parse_pattern(pattern or ""):
+        if isinstance(part, str):
+            out.append(part)
+            continue
+        line_no, start, stop = part
+        if line_no >= len(lines):
+            continue
         text = lines[line_no]
-        if start_pos:
-            start = max(int(start_pos) - 1, 0)
-            if end_pos:
-                stop = int(end_pos)
-                text = text[start:stop]
-            else:
-                text = text[start:]
+        if start is not None:
+            text = text[start:stop]
         text = text.strip()
         if text:
             resolved += 1
-        return text
-
-    return LINE_TOKEN_RE.sub(replace_token, pattern or ""), resolved
+            out.append(text)
+    return "".join(out), resolved
 
 
 def build_value_from_line_pattern(lines, pattern: str) -> str:
@@ -264,13 +452,16 @@ def build_value_from_line_pattern(lines, pattern: str) -> str:
 
 
 def build_filename_from_line_pattern(lines, pattern: str) -> str:
+    parts = _parse_pattern(pattern or "")
+    if not parts:
+        return ""
     raw, resolved = _resolve_line_pattern(lines, pattern)
 
     # If the pattern relies on tokens but none of them produced a real value,
     # treat the page as unresolved — even if literal separators (e.g. "_",
     # spaces, brackets) would otherwise leave a non-empty string like "_.pdf".
     # Such pages must go to !manual_review, not be saved under a junk name.
-    if LINE_TOKEN_RE.search(pattern or "") and resolved == 0:
+    if resolved == 0 and any(not isinstance(p, str) for p in parts):
         return ""
 
     if not raw:
@@ -278,6 +469,9 @@ def build_filename_from_line_pattern(lines, pattern: str) -> str:
     if not raw.lower().endswith(".pdf"):
         raw += ".pdf"
     base, ext = os.path.splitext(raw)
+    # Plain ASCII identifiers (letters, digits, "_") are already safe as-is.
+    if base.isascii() and base.isidentifier():
+        return base + ext
     safe = sanitize_filename(base)
     if not safe:
         return ""
@@ -357,15 +551,20 @@ def _friendly_open_error(exc) -> str:
     )
 
 
-def open_pdf_checked(path: str):
+def open_pdf_checked(path: str, data=None):
     """Open a PDF, raising PdfError(friendly message) for common problems.
 
     Returns an open fitz document (caller must close it). Password-protected,
     corrupt, missing and non-PDF files all raise PdfError with a message that
     is safe to show a user; the technical detail is written to the app log.
+    If ``data`` (the file's bytes, already read) is given, it is parsed
+    instead of reading ``path`` again.
     """
     try:
-        doc = fitz.open(path)
+        if data is not None:
+            doc = fitz.open(stream=data, filetype="pdf")
+        else:
+            doc = fitz.open(path)
     except Exception as e:
         write_app_log(f"[pdf-open-error] {path}: {e!r}")
         raise PdfError(_friendly_open_error(e)) from e
@@ -419,6 +618,151 @@ def preflight_pdf(path: str, sample_pages: int = 3):
 
 # -------------------- Full payroll engine --------------------
 
+# Pages are handed to pool workers in chunks, so a large payroll PDF doesn't
+# pay the per-task overhead for every single page.
+SPLIT_CHUNK_PAGES = 25
+SPLIT_MAX_WORKERS = 8
+# A spawned worker re-imports the app, tkinter and PyMuPDF (~0.3 s each)
+# before it can take a page, while a page costs ~1-3 ms in-process. Below this
+# many pages the in-process run is done before a pool would be ready.
+SPLIT_POOL_MIN_PAGES = 300
+
+
+def _scan_page_chunk(
+    inp_path,
+    page_indices,
+    file_pattern,
+    folder_pattern,
+    debug_index,
+):
+    """Worker: read the text of a chunk of pages and build their names.
+
+    Runs in a pool process, so it opens its own document. Returns one dict per
+    page, in page order; ``lines`` is only kept for ``debug_index``.
+    """
+    results = []
+    # Opened by path: MuPDF reads only the objects it needs. Handing it the
+    # file in memory (stream=, mmap) would copy the whole PDF into every
+    # worker.
+    with fitz.open(inp_path) as doc:
+        for page_index in page_indices:
+            # Default flags and no clip rectangle on purpose: line numbers and
+            # text must match what get_page_lines shows in the Pattern Builder.
+            # Lines come out in content-stream order, not top-to-bottom, so a
+            # clip to the header area can drop and renumber earlier lines.
+            text = doc.load_page(page_index).get_text()
+            lines = text.splitlines()
+            filename = build_filename_from_line_pattern(lines, file_pattern)
+            results.append(
+                {
+                    "index": page_index,
+                    "filename": filename,
+                    "raw_folder": build_value_from_line_pattern(lines, folder_pattern),
+                    "excerpt": "" if filename else text.replace("\n", " ")[:300],
+                    "lines": lines if page_index == debug_index else None,
+                }
+            )
+    return results
+
+
+# Set in pool workers started with a stop event (see _make_split_executor);
+# _write_page_chunk checks it between pages.
+_worker_stop_event = None
+
+
+def _init_split_worker(stop_event):
+    global _worker_stop_event
+    _worker_stop_event = stop_event
+
+
+def _write_page_chunk(inp_path, jobs):
+    """Worker: save each ``(page_index, out_path)`` job as a one-page PDF.
+
+    Returns how many jobs were written, in order; fewer than ``len(jobs)``
+    only when the pool's stop event was set part-way.
+
+    A fresh output document per page is deliberate: reusing one and calling
+    delete_page() after each save leaves the copied objects behind, so every
+    later file carries the earlier pages' resources (or needs a garbage pass
+    on save, which costs far more than the new document does).
+    """
+    written = 0
+    with fitz.open(inp_path) as doc:
+        for page_index, out_path in jobs:
+            if _worker_stop_event is not None and _worker_stop_event.is_set():
+                break
+            _save_single_page(doc, page_index, out_path)
+            written += 1
+    return written
+
+
+def _save_single_page(doc, page_index, out_path):
+    new_doc = fitz.open()
+    new_doc.insert_pdf(doc, from_page=page_index, to_page=page_index)
+    new_doc.save(out_path)
+    new_doc.close()
+
+
+class _InlineExecutor:
+    """Executor stand-in that runs each call immediately, in this process.
+
+    Used for small PDFs (or when no pool can be started) so the split engine
+    has a single code path either way.
+    """
+
+    def submit(self, fn, *args):
+        fut = Future()
+        try:
+            fut.set_result(fn(*args))
+        except BaseException as e:
+            fut.set_exception(e)
+        return fut
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+
+def _make_split_executor(
+    page_count: int, chunk_count: int, max_workers=None, stop_event=None
+):
+    """Return ``(executor, workers)`` for ``page_count`` pages in ``chunk_count``
+    tasks.
+
+    PyMuPDF holds the GIL and is not thread-safe, so real parallelism needs
+    processes. Each worker opens the input PDF itself. With ``max_workers``
+    left as None, runs under SPLIT_POOL_MIN_PAGES stay in-process.
+    ``stop_event`` (a spawn-context Event) is handed to the workers so
+    _write_page_chunk can stop between pages.
+    """
+    if max_workers is None:
+        if page_count < SPLIT_POOL_MIN_PAGES:
+            return _InlineExecutor(), 1
+        max_workers = min(os.cpu_count() or 1, SPLIT_MAX_WORKERS)
+    workers = min(max_workers, chunk_count)
+    if workers <= 1:
+        return _InlineExecutor(), 1
+    executor = None
+    try:
+        # "spawn" everywhere: the GUI starts splits from a thread next to Tk,
+        # where forking is unsafe.
+        ctx = multiprocessing.get_context("spawn")
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=ctx,
+            initializer=_init_split_worker if stop_event is not None else None,
+            initargs=(stop_event,) if stop_event is not None else (),
+        )
+        # Workers are only started on the first submit, so a pool that can't
+        # run (no interpreter to spawn, blocked by policy) fails here rather
+        # than part-way through the split.
+        executor.submit(os.getpid).result()
+        return executor, workers
+    except Exception as e:
+        write_app_log(f"[split-pool] running in-process instead: {e!r}")
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return _InlineExecutor(), 1
+
 
 def split_pdf_full(
     inp_path: str,
@@ -431,6 +775,7 @@ def split_pdf_full(
     log_callback=None,
     progress_callback=None,
     cancel_event=None,
+    max_workers=None,
 ):
     def log(msg: str):
         write_app_log(msg)
@@ -441,9 +786,9 @@ def split_pdf_full(
 
     doc = open_pdf_checked(inp_path)
     total_pages = len(doc)
+    doc.close()
     if total_pages == 0:
         log("⚠ PDF has no pages.")
-        doc.close()
         return {
             "total": 0,
             "success": 0,
@@ -464,134 +809,211 @@ def split_pdf_full(
     success = 0
     failed = 0
     cancelled = False
+    used_names = {}
 
-    for page_index in range(total_pages):
-        if cancel_event is not None and cancel_event.is_set():
-            cancelled = True
-            log("⛔ Cancelled by user — stopping before next page.")
-            break
-
-        page_no = page_index + 1
-        if progress_callback:
-            progress_callback(page_no, total_pages)
-
-        page = doc.load_page(page_index)
-        text = page.get_text()
-        lines = text.splitlines()
-
-        if safe_mode and page_no == 1:
-            log(f"[DEBUG] --- PAGE {page_no} ---")
-            for idx, line in enumerate(lines):
-                log(f"  LINE {idx}: {line}")
-            log("–––––––––––––––––––––––––––––––––––––––")
-
-        filename = build_filename_from_line_pattern(lines, file_pattern)
-        raw_folder = build_value_from_line_pattern(lines, folder_pattern)
-        foldername = normalize_folder_name(raw_folder) if raw_folder else ""
-
-        if not filename or filename == ".pdf":
-            failed += 1
-            excerpt = text.replace("\n", " ")[:300]
-            log(f"⚠ Page {page_no}: no valid filename → manual review needed")
-            write_app_log(f"[manual_review] Page {page_no} excerpt: {excerpt}")
-
-            if safe_mode:
-                audit_rows.append(
-                    {
-                        "Page": page_no,
-                        "Status": "Failed (SAFE mode)",
-                        "Filename": "",
-                        "FolderRaw": raw_folder or "",
-                        "FolderName": foldername or "",
-                        "Note": "Would be sent to !manual_review",
-                    }
-                )
-                continue
-
-            new_doc = fitz.open()
-            new_doc.insert_pdf(doc, from_page=page_index, to_page=page_index)
-            review_name = f"Unmatched_Page_{page_no}.pdf"
-            review_path = os.path.join(review_dir, review_name)
-            new_doc.save(review_path)
-            new_doc.close()
-
-            audit_rows.append(
-                {
-                    "Page": page_no,
-                    "Status": "Failed",
-                    "Filename": "",
-                    "FolderRaw": raw_folder or "",
-                    "FolderName": foldername or "",
-                    "Note": f"Sent to {review_name}",
-                }
-            )
-            continue
-
-        if save_to_folders:
-            if foldername:
-                target_dir = os.path.join(out_dir, foldername)
-            else:
-                target_dir = os.path.join(out_dir, "unknown")
-        else:
-            target_dir = out_dir
-
-        if safe_mode:
-            final_name = filename
-            audit_rows.append(
-                {
-                    "Page": page_no,
-                    "Status": "OK (SAFE mode)",
-                    "Filename": final_name,
-                    "FolderRaw": raw_folder or "",
-                    "FolderName": foldername or "",
-                    "Note": "Would be saved",
-                }
-            )
-            log(
-                f"🔎 [SAFE] Page {page_no}: would save as "
-                f"{os.path.join(target_dir, final_name)}"
-            )
-            continue
-
-        os.makedirs(target_dir, exist_ok=True)
+    # Rows go to the audit CSV as pages are named, so a long run (or one that
+    # dies part-way) still leaves a usable log on disk.
+    audit = None if safe_mode else AuditCsvWriter(get_unique_auditlog_path(out_dir))
 
-        final_name = filename
-        base, ext = os.path.splitext(final_name)
-        counter = 1
-        while os.path.exists(os.path.join(target_dir, final_name)):
-            final_name = f"{base}_{counter}{ext}"
-            counter += 1
+    def add_row(row):
+        nonlocal audit
+        audit_rows.append(row)
+        if audit is None:
+            return
+        try:
+            audit.writerow(row)
+        except Exception as e:
+            log(f"❌ Failed to write audit log: {e}")
+            audit.close()
+            audit = None
+
+    chunks = [
+        range(start, min(start + SPLIT_CHUNK_PAGES, total_pages))
+        for start in range(0, total_pages, SPLIT_CHUNK_PAGES)
+    ]
+    executor, workers = _make_split_executor(total_pages, len(chunks), max_workers)
+    # Keep every worker busy (one chunk queued behind each), but don't scan
+    # far ahead of what has been named — a cancel would throw that work away.
+    read_ahead = workers * 2 if workers > 1 else 1
+    debug_index = 0 if safe_mode else None
+    scans = deque()
+    writes = deque()
+    next_chunk = 0
+
+    write_error = None
+
+    # A chunk's audit rows (and its success count) are recorded only once its
+    # files are on disk; if the save fails, every page in it is logged as
+    # Failed instead, so the CSV never lists a file that doesn't exist.
+    def finish_write(fut, pending):
+        nonlocal success, write_error
+        try:
+            fut.result()
+        except Exception as e:
+            write_error = write_error or e
+            log(f"❌ Failed to save pages: {e}")
+            for row, _msg in pending:
+                add_row({**row, "Status": "Failed", "Note": f"Not saved: {e}"})
+            return
+        for row, msg in pending:
+            if row["Status"] == "OK":
+                success += 1
+            add_row(row)
+            if msg:
+                log(msg)
 
-        out_path = os.path.join(target_dir, final_name)
-        new_doc = fitz.open()
-        new_doc.insert_pdf(doc, from_page=page_index, to_page=page_index)
-        new_doc.save(out_path)
-        new_doc.close()
+    try:
+        while scans or next_chunk < len(chunks):
+            while next_chunk < len(chunks) and len(scans) < read_ahead:
+                scans.append(
+                    executor.submit(
+                        _scan_page_chunk,
+                        inp_path,
+                        chunks[next_chunk],
+                        file_pattern,
+                        folder_pattern,
+                        debug_index,
+                    )
+                )
+                next_chunk += 1
+
+            jobs = []
+            pending = []
+            for page in scans.popleft().result():
+                if cancel_event is not None and cancel_event.is_set():
+                    cancelled = True
+                    log("⛔ Cancelled by user — stopping before next page.")
+                    break
+
+                page_index = page["index"]
+                page_no = page_index + 1
+                if progress_callback:
+                    progress_callback(page_no, total_pages)
+
+                if page["lines"] is not None:
+                    log(f"[DEBUG] --- PAGE {page_no} ---")
+                    for idx, line in enumerate(page["lines"]):
+                        log(f"  LINE {idx}: {line}")
+                    log("–––––––––––––––––––––––––––––––––––––––")
+
+                filename = page["filename"]
+                raw_folder = page["raw_folder"]
+                foldername = normalize_folder_name(raw_folder) if raw_folder else ""
+
+                if not filename or filename == ".pdf":
+                    failed += 1
+                    log(
+                        f"⚠ Page {page_no}: no valid filename → "
+                        "manual review needed"
+                    )
+                    write_app_log(
+                        f"[manual_review] Page {page_no} excerpt: {page['excerpt']}"
+                    )
+
+                    if safe_mode:
+                        add_row(
+                            {
+                                "Page": page_no,
+                                "Status": "Failed (SAFE mode)",
+                                "Filename": "",
+                                "FolderRaw": raw_folder or "",
+                                "FolderName": foldername or "",
+                                "Note": "Would be sent to !manual_review",
+                            }
+                        )
+                        continue
+
+                    review_name = f"Unmatched_Page_{page_no}.pdf"
+                    jobs.append((page_index, os.path.join(review_dir, review_name)))
+                    pending.append(
+                        (
+                            {
+                                "Page": page_no,
+                                "Status": "Failed",
+                                "Filename": "",
+                                "FolderRaw": raw_folder or "",
+                                "FolderName": foldername or "",
+                                "Note": f"Sent to {review_name}",
+                            },
+                            None,
+                        )
+                    )
+                    continue
+
+                if save_to_folders:
+                    if foldername:
+                        target_dir = os.path.join(out_dir, foldername)
+                    else:
+                        target_dir = os.path.join(out_dir, "unknown")
+                else:
+                    target_dir = out_dir
+
+                if safe_mode:
+                    final_name = filename
+                    add_row(
+                        {
+                            "Page": page_no,
+                            "Status": "OK (SAFE mode)",
+                            "Filename": final_name,
+                            "FolderRaw": raw_folder or "",
+                            "FolderName": foldername or "",
+                            "Note": "Would be saved",
+                        }
+                    )
+                    log(
+                        f"🔎 [SAFE] Page {page_no}: would save as "
+                        f"{os.path.join(target_dir, final_name)}"
+                    )
+                    continue
+
+                # Each folder is created (and then listed by
+                # reserve_unique_name) once per run, not once per page.
+                if target_dir not in used_names:
+                    os.makedirs(target_dir, exist_ok=True)
+
+                final_name = reserve_unique_name(target_dir, filename, used_names)
+                out_path = os.path.join(target_dir, final_name)
+                jobs.append((page_index, out_path))
+                pending.append(
+                    (
+                        {
+                            "Page": page_no,
+                            "Status": "OK",
+                            "Filename": final_name,
+                            "FolderRaw": raw_folder or "",
+                            "FolderName": foldername or "",
+                            "Note": "",
+                        },
+                        f"✅ Page {page_no}: saved as {out_path}",
+                    )
+                )
 
-        success += 1
-        log(f"✅ Page {page_no}: saved as {out_path}")
-        audit_rows.append(
-            {
-                "Page": page_no,
-                "Status": "OK",
-                "Filename": final_name,
-                "FolderRaw": raw_folder or "",
-                "FolderName": foldername or "",
-                "Note": "",
-            }
-        )
+            if jobs:
+                writes.append(
+                    (executor.submit(_write_page_chunk, inp_path, jobs), pending)
+                )
+            while writes and writes[0][0].done():
+                finish_write(*writes.popleft())
+            if audit is not None:
+                audit.flush()
+            if cancelled or write_error is not None:
+                break
+    finally:
+        # Pages already handed to a writer are named, so let their writes land
+        # (after a cancel or an error too) and record how each one went.
+        while writes:
+            finish_write(*writes.popleft())
+        executor.shutdown(wait=True, cancel_futures=True)
+        if audit is not None:
+            audit.close()
 
-    doc.close()
+    if write_error is not None:
+        raise write_error
 
     audit_path = None
-    if not safe_mode and audit_rows:
-        audit_path = get_unique_auditlog_path(out_dir)
-        try:
-            write_audit_csv(audit_path, audit_rows)
-            log(f"🧾 Audit log saved: {audit_path}")
-        except Exception as e:
-            log(f"❌ Failed to write audit log: {e}")
-            audit_path = None
+    if audit is not None and audit.rows_written:
+        audit_path = audit.path
+        log(f"🧾 Audit log saved: {audit_path}")
     elif safe_mode:
         log("SAFE MODE: no audit CSV written.")
 
@@ -600,6 +1022,8 @@ def split_pdf_full(
         f"Manual review={failed}" + (", CANCELLED" if cancelled else "")
     )
 
+    flush_app_log()
+
     if (not safe_mode) and auto_open and not cancelled:
         open_folder(out_dir, log)
 
@@ -616,23 +1040,140 @@ def split_pdf_full(
 # -------------------- PDF Tools core functions --------------------
 
 
+def _write_pages_pooled(
+    inp_path, jobs, log, progress_callback, cancel_event, max_workers=None
+):
+    """Write ``(page_index, out_path)`` jobs as one-page PDFs on the worker pool.
+
+    Jobs go out in chunks, like split_pdf_full's writes, with progress
+    reported per page as each chunk lands. A cancel drops the chunks no worker
+    has picked up and tells the running ones to stop before their next page.
+    Runs too small for a pool are written here one page at a time.
+    """
+    total = len(jobs)
+    done = 0
+
+    def page_done(page_index, out_path):
+        nonlocal done
+        done += 1
+        log(f"✅ Extracted page {page_index + 1} → {out_path}")
+        if progress_callback:
+            progress_callback(done, total)
+
+    def cancel_requested():
+        if cancel_event is not None and cancel_event.is_set():
+            log("⛔ Extract cancelled by user.")
+            return True
+        return False
+
+    chunks = [
+        jobs[start:start + SPLIT_CHUNK_PAGES]
+        for start in range(0, total, SPLIT_CHUNK_PAGES)
+    ]
+    stop = multiprocessing.get_context("spawn").Event()
+    executor, workers = _make_split_executor(
+        total, len(chunks), max_workers, stop_event=stop
+    )
+    if workers == 1:
+        with fitz.open(inp_path) as doc:
+            for page_index, out_path in jobs:
+                if cancel_requested():
+                    break
+                _save_single_page(doc, page_index, out_path)
+                page_done(page_index, out_path)
+        return
+
+    # No more chunks in flight than there are workers (the pool queues one
+    # extra on its own), so queued work never piles up behind a cancel.
+    read_ahead = workers
+    pending = deque()
+    next_chunk = 0
+    cancelled = False
+    try:
+        while True:
+            if not cancelled and cancel_requested():
+                cancelled = True
+                stop.set()
+                # cancel() fails for chunks a worker already holds; those
+                # return early once they see the stop event.
+                pending = deque(item for item in pending if not item[0].cancel())
+            while (
+                not cancelled
+                and next_chunk < len(chunks)
+                and len(pending) < read_ahead
+            ):
+                chunk = chunks[next_chunk]
+                fut = executor.submit(_write_page_chunk, inp_path, chunk)
+                pending.append((fut, chunk))
+                next_chunk += 1
+            if not pending:
+                break
+            # Wait in short steps so a cancel reaches the workers mid-chunk.
+            if not wait([pending[0][0]], timeout=0.1).done:
+                continue
+            fut, chunk = pending.popleft()
+            for page_index, out_path in chunk[: fut.result()]:
+                page_done(page_index, out_path)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def parse_pages(single_page: str, range_from: str, range_to: str) -> tuple:
+    """Turn the Extract fields into ``(page_indices, single)``.
+
+    ``page_indices`` are 0-based; ``single`` is True when the single-page field
+    was used (it wins over a range, as in the form). Raises ``ValueError`` for
+    anything that can be rejected without opening the PDF; the upper bound is
+    checked by :func:`extract_pages` once the page count is known.
+    """
+    def to_int(value):
+        try:
+            return int(value)
+        except ValueError:
+            raise ValueError("Page numbers must be whole numbers.") from None
+
+    if single_page:
+        p = to_int(single_page)
+        if p < 1:
+            raise ValueError("Page number out of range.")
+        return (p - 1,), True
+    if range_from and range_to:
+        a = to_int(range_from)
+        b = to_int(range_to)
+        if a < 1 or a > b:
+            raise ValueError("Invalid page range.")
+        return tuple(range(a - 1, b)), False
+    raise ValueError("Specify single page or a page range.")
+
+
 def extract_pages(
     inp_path: str,
     out_dir: str,
-    single_page: str,
-    range_from: str,
-    range_to: str,
+    page_indices,
+    single_page: bool,
     per_page: bool,
     auto_open: bool,
     log_callback=None,
     progress_callback=None,
     cancel_event=None,
+    max_workers=None,
 ):
+    """Extract ``page_indices`` (from :func:`parse_pages`: ascending and
+    contiguous) into one PDF, or one PDF per page when ``per_page`` is set.
+
+    ``single_page`` selects the single-page naming; a range keeps range
+    naming even when it covers one page.
+    """
+
     def log(msg: str):
         write_app_log(msg)
         if log_callback:
             log_callback(msg)
 
+    if not page_indices:
+        raise ValueError("Specify single page or a page range.")
+    first, last = page_indices[0], page_indices[-1]
+
     log(f"🕒 Extract started: {inp_path}")
     doc = open_pdf_checked(inp_path)
     total = len(doc)
@@ -641,63 +1182,74 @@ def extract_pages(
         doc.close()
         return
 
-    os.makedirs(out_dir, exist_ok=True)
-
     try:
+        if last >= total:
+            raise ValueError(
+                "Page number out of range." if single_page else "Invalid page range."
+            )
+
+        os.makedirs(out_dir, exist_ok=True)
+
         if single_page:
-            p = int(single_page)
-            if p < 1 or p > total:
-                raise ValueError("Page number out of range.")
+            p = first + 1
             if progress_callback:
                 progress_callback(1, 1)
             new_doc = fitz.open()
-            new_doc.insert_pdf(doc, from_page=p - 1, to_page=p - 1)
+            new_doc.insert_pdf(doc, from_page=first, to_page=first)
             out_name = extraction_filename(inp_path, page=p)
             final_path = get_unique_path(os.path.join(out_dir, out_name))
             new_doc.save(final_path)
             new_doc.close()
             log(f"✅ Extracted single page {p} → {final_path}")
 
-        elif range_from and range_to:
-            a = int(range_from)
-            b = int(range_to)
-            if a < 1 or b > total or a > b:
-                raise ValueError("Invalid page range.")
-
-            if per_page:
-                count = b - a + 1
-                for done, p in enumerate(range(a, b + 1), start=1):
-                    if cancel_event is not None and cancel_event.is_set():
-                        log("⛔ Extract cancelled by user.")
-                        break
-                    if progress_callback:
-                        progress_callback(done, count)
-                    new_doc = fitz.open()
-                    new_doc.insert_pdf(doc, from_page=p - 1, to_page=p - 1)
-                    out_name = extraction_filename(inp_path, page=p)
-                    final_path = get_unique_path(os.path.join(out_dir, out_name))
-                    new_doc.save(final_path)
-                    new_doc.close()
-                    log(f"✅ Extracted page {p} → {final_path}")
-            else:
-                if progress_callback:
-                    progress_callback(1, 1)
-                new_doc = fitz.open()
-                new_doc.insert_pdf(doc, from_page=a - 1, to_page=b - 1)
-                out_name = extraction_filename(inp_path, page_from=a, page_to=b)
-                final_path = get_unique_path(os.path.join(out_dir, out_name))
-                new_doc.save(final_path)
-                new_doc.close()
-                log(f"✅ Extracted pages {a}-{b} → {final_path}")
+        elif per_page:
+            used_names = {}
+            jobs = []
+            for i in page_indices:
+                out_name = extraction_filename(inp_path, page=i + 1)
+                out_path = get_unique_path(os.path.join(out_dir, out_name), used_names)
+                jobs.append((i, out_path))
+            _write_pages_pooled(
+                inp_path, jobs, log, progress_callback, cancel_event, max_workers
+            )
+
         else:
-            raise ValueError("Specify single page or a page range.")
+            a, b = first + 1, last + 1
+            if progress_callback:
+                progress_callback(1, 1)
+            new_doc = fitz.open()
+            new_doc.insert_pdf(doc, from_page=first, to_page=last)
+            out_name = extraction_filename(inp_path, page_from=a, page_to=b)
+            final_path = get_unique_path(os.path.join(out_dir, out_name))
+            new_doc.save(final_path)
+            new_doc.close()
+            log(f"✅ Extracted pages {a}-{b} → {final_path}")
     finally:
         doc.close()
+        flush_app_log()
 
     if auto_open:
         open_folder(out_dir, log)
 
 
+# Merge reads the next few source files on background threads while the
+# current one is parsed and appended. File reads release the GIL; PyMuPDF
+# doesn't, so parsing and insert_pdf stay on the calling thread, in order.
+# MERGE_READ_AHEAD_MAX_BYTES caps the total held in memory (files read ahead
+# plus the one being merged); a file bigger than that is opened by path.
+MERGE_READ_AHEAD = 4
+MERGE_READ_AHEAD_MAX_BYTES = 256 * 1024 * 1024
+
+
+# Merge sources are read whole (within the budget) so the disk read overlaps
+# the previous file's merge; split/extract workers open the input by path
+# instead, since every worker would otherwise hold its own copy of the PDF.
+def _read_merge_source(path: str):
+    """Read a merge source into memory."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
 def merge_pdfs(
     files,
     out_dir: str,
@@ -727,11 +1279,31 @@ def merge_pdfs(
 
     final_out = get_unique_path(base_out)
 
+    files = list(files)
     total = len(files)
     merged = fitz.open()
     cancelled = False
+    reader = ThreadPoolExecutor(max_workers=min(MERGE_READ_AHEAD, total))
+    reads = deque()  # (future or None, size); None: open by path
+    buffered = 0
+    next_read = 0
     try:
         for i, p in enumerate(files, start=1):
+            while next_read < total and len(reads) < MERGE_READ_AHEAD:
+                path = files[next_read]
+                try:
+                    size = os.path.getsize(path)
+                except OSError:
+                    # Missing/unreadable: open_pdf_checked reports it properly.
+                    size = None
+                if size is None or size > MERGE_READ_AHEAD_MAX_BYTES:
+                    reads.append((None, 0))
+                elif buffered + size <= MERGE_READ_AHEAD_MAX_BYTES:
+                    reads.append((reader.submit(_read_merge_source, path), size))
+                    buffered += size
+                else:
+                    break
+                next_read += 1
             if cancel_event is not None and cancel_event.is_set():
                 cancelled = True
                 log("⛔ Merge cancelled by user.")
@@ -739,7 +1311,12 @@ def merge_pdfs(
             if progress_callback:
                 progress_callback(i, total)
             log(f"  + {p}")
-            src = open_pdf_checked(p)
+            fut, size = reads.popleft()
+            try:
+                data = fut.result() if fut is not None else None
+            except OSError:
+                data = None
+            src = open_pdf_checked(p, data)
             try:
                 merged.insert_pdf(src)
             finally:
@@ -747,11 +1324,15 @@ def merge_pdfs(
                     src.close()
                 except Exception:
                     pass
+            data = None
+            buffered -= size
         if not cancelled:
             merged.save(final_out)
             log(f"✅ Merged PDF saved: {final_out}")
     finally:
+        reader.shutdown(wait=False, cancel_futures=True)
         merged.close()
+        flush_app_log()
 
     if auto_open and not cancelled:
         open_folder(out_dir, log)
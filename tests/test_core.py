@@ -1,12 +1,15 @@
-"""Unit tests for splitpay_core (pure logic — no PDFs, no GUI needed).
+"""Unit tests for splitpay_core (no GUI needed; the split engine tests build
+small PDFs with PyMuPDF and are skipped when it isn't installed).
 
 Run from the repository root:
     python -m unittest discover tests -v
 """
 
+import csv
 import os
 import sys
 import tempfile
+import threading
 import types
 import unittest
 
@@ -16,8 +19,11 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # don't use it, so a stub is enough when PyMuPDF isn't installed.
 try:
     import fitz  # noqa: F401
+
+    HAS_PYMUPDF = True
 except ImportError:
     sys.modules["fitz"] = types.ModuleType("fitz")
+    HAS_PYMUPDF = False
 
 import splitpay_core as core  # noqa: E402
 
@@ -93,6 +99,12 @@ class TestLinePatterns(unittest.TestCase):
         result = core.build_filename_from_line_pattern(self.LINES, "[LINE 1].pdf")
         self.assertEqual(result, "John_Doe.pdf")
 
+    def test_parsed_pattern_splits_literals_and_tokens(self):
+        self.assertEqual(
+            core._parse_pattern("X_[LINE 2(1/3)]_[LINE 4(5)][LINE 0].pdf"),
+            ("X_", (2, 0, 3), "_", (4, 4, None), (0, None, None), ".pdf"),
+        )
+
 
 class TestUnresolvedTokens(unittest.TestCase):
     """A pattern whose tokens all resolve empty must yield no filename, even
@@ -179,6 +191,36 @@ class TestUniquePaths(unittest.TestCase):
             open(os.path.join(d, "f_1.pdf"), "w").close()
             self.assertEqual(core.get_unique_path(p), os.path.join(d, "f_2.pdf"))
 
+    def test_unique_path_with_shared_listing(self):
+        with tempfile.TemporaryDirectory() as d:
+            open(os.path.join(d, "f.pdf"), "w").close()
+            used = {}
+            p = os.path.join(d, "f.pdf")
+            self.assertEqual(core.get_unique_path(p, used), os.path.join(d, "f_1.pdf"))
+            # f_1 is reserved in memory even though it was never written.
+            self.assertEqual(core.get_unique_path(p, used), os.path.join(d, "f_2.pdf"))
+
+    def test_reserved_names_are_skipped_before_files_exist(self):
+        with tempfile.TemporaryDirectory() as d:
+            open(os.path.join(d, "b.pdf"), "w").close()
+            used = {}
+            self.assertEqual(core.reserve_unique_name(d, "a.pdf", used), "a.pdf")
+            self.assertEqual(core.reserve_unique_name(d, "a.pdf", used), "a_1.pdf")
+            self.assertEqual(core.reserve_unique_name(d, "b.pdf", used), "b_1.pdf")
+
+    def test_reservation_lists_a_folder_once(self):
+        with tempfile.TemporaryDirectory() as d:
+            used = {}
+            core.reserve_unique_name(d, "a.pdf", used)
+            # Created after the listing: not seen, by design (single readdir).
+            open(os.path.join(d, "c.pdf"), "w").close()
+            self.assertEqual(core.reserve_unique_name(d, "c.pdf", used), "c.pdf")
+
+    def test_missing_folder_has_no_taken_names(self):
+        with tempfile.TemporaryDirectory() as d:
+            missing = os.path.join(d, "nope")
+            self.assertEqual(core.reserve_unique_name(missing, "a.pdf", {}), "a.pdf")
+
 
 class TestAuditCsv(unittest.TestCase):
     def test_roundtrip(self):
@@ -211,6 +253,426 @@ class TestAuditCsv(unittest.TestCase):
         self.assertIn("johndoe", lines[1])
         self.assertIn("Unmatched_Page_2.pdf", lines[2])
 
+    def test_streaming_writer_matches_bulk_write(self):
+        rows = [
+            {"Page": 1, "Status": "OK", "Filename": "a.pdf", "FolderRaw": "",
+             "FolderName": "", "Note": ""},
+            {"Page": 2, "Status": "Failed", "Filename": "", "FolderRaw": "",
+             "FolderName": "", "Note": "Sent to Unmatched_Page_2.pdf"},
+        ]
+        with tempfile.TemporaryDirectory() as d:
+            bulk = os.path.join(d, "bulk.csv")
+            streamed = os.path.join(d, "streamed.csv")
+            core.write_audit_csv(bulk, rows)
+            writer = core.AuditCsvWriter(streamed)
+            for row in rows:
+                writer.writerow(row)
+            writer.close()
+            with open(bulk, "rb") as a, open(streamed, "rb") as b:
+                self.assertEqual(a.read(), b.read())
+            self.assertEqual(writer.rows_written, 2)
+
+    def test_streaming_writer_without_rows_creates_no_file(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "audit.csv")
+            core.AuditCsvWriter(path).close()
+            self.assertFalse(os.path.exists(path))
+
+
+class _RecordingPool:
+    """ProcessPoolExecutor stand-in that runs calls inline and counts pools."""
+
+    created = 0
+
+    def __init__(self, *args, **kwargs):
+        _RecordingPool.created += 1
+
+    def submit(self, fn, *args):
+        return core._InlineExecutor().submit(fn, *args)
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+
+class TestSplitExecutor(unittest.TestCase):
+    def setUp(self):
+        self._orig_pool = core.ProcessPoolExecutor
+        self._orig_cpu_count = os.cpu_count
+        os.cpu_count = lambda: 4
+        _RecordingPool.created = 0
+
+    def tearDown(self):
+        core.ProcessPoolExecutor = self._orig_pool
+        os.cpu_count = self._orig_cpu_count
+
+    def test_single_chunk_runs_in_process(self):
+        executor, workers = core._make_split_executor(25, 1, max_workers=4)
+        self.assertIsInstance(executor, core._InlineExecutor)
+        self.assertEqual(workers, 1)
+
+    def test_pool_that_cannot_start_falls_back_in_process(self):
+        class _BrokenPool:
+            def __init__(self, *args, **kwargs):
+                self.shut_down = False
+
+            def submit(self, fn, *args):
+                raise OSError("handle is closed")
+
+            def shutdown(self, wait=True, cancel_futures=False):
+                self.shut_down = True
+
+        core.ProcessPoolExecutor = _BrokenPool
+        executor, workers = core._make_split_executor(100, 4, max_workers=2)
+        self.assertIsInstance(executor, core._InlineExecutor)
+        self.assertEqual(workers, 1)
+
+    def test_small_run_stays_in_process_by_default(self):
+        core.ProcessPoolExecutor = _RecordingPool
+        pages = core.SPLIT_CHUNK_PAGES + 1
+        executor, workers = core._make_split_executor(pages, 2)
+        self.assertIsInstance(executor, core._InlineExecutor)
+        self.assertEqual(_RecordingPool.created, 0)
+
+    def test_large_run_uses_pool_by_default(self):
+        core.ProcessPoolExecutor = _RecordingPool
+        pages = core.SPLIT_POOL_MIN_PAGES
+        chunks = -(-pages // core.SPLIT_CHUNK_PAGES)
+        executor, workers = core._make_split_executor(pages, chunks)
+        self.assertIsInstance(executor, _RecordingPool)
+        self.assertEqual(workers, 4)
+
+
+def _make_pdf(path, page_texts):
+    """Write a PDF with one page per text (blank text: blank page)."""
+    doc = fitz.open()
+    for text in page_texts:
+        page = doc.new_page()
+        if text:
+            page.insert_text((72, 72), text)
+    doc.save(path)
+    doc.close()
+
+
+@unittest.skipUnless(HAS_PYMUPDF, "PyMuPDF not installed")
+class TestSplitPdfFull(unittest.TestCase):
+    """End-to-end splits of a generated PDF: 60 pages (three chunks), with
+    repeated names and a few blank pages that go to manual review."""
+
+    PAGES = 60
+
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.pdf = os.path.join(cls._tmp.name, "payroll.pdf")
+        _make_pdf(
+            cls.pdf,
+            [
+                "" if i % 17 == 16 else f"Payslip\nEmployee {i % 20}\nDept {i % 2}"
+                for i in range(cls.PAGES)
+            ],
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    def setUp(self):
+        self._out = tempfile.TemporaryDirectory()
+        self.out = self._out.name
+
+    def tearDown(self):
+        self._out.cleanup()
+
+    def split(self, out_dir, **kwargs):
+        return core.split_pdf_full(
+            inp_path=self.pdf,
+            out_dir=out_dir,
+            file_pattern="[LINE 1]",
+            folder_pattern="[LINE 2]",
+            save_to_folders=True,
+            safe_mode=False,
+            auto_open=False,
+            **kwargs,
+        )
+
+    def files_on_disk(self, out_dir):
+        found = set()
+        for dirpath, _dirs, files in os.walk(out_dir):
+            for name in files:
+                if name.lower().endswith(".pdf"):
+                    found.add(os.path.relpath(os.path.join(dirpath, name), out_dir))
+        return found
+
+    def files_in_audit(self, result):
+        with open(result["audit_path"], "r", encoding="utf-8-sig") as f:
+            rows = list(csv.DictReader(f))
+        expected = set()
+        for row in rows:
+            if row["Status"] == "OK":
+                folder = row["FolderName"] or "unknown"
+                expected.add(os.path.join(folder, row["Filename"]))
+            elif row["Note"].startswith("Sent to "):
+                review_name = row["Note"][len("Sent to "):]
+                expected.add(os.path.join("!manual_review", review_name))
+        return rows, expected
+
+    def test_audit_matches_files_on_disk(self):
+        result = self.split(self.out, max_workers=1)
+        rows, expected = self.files_in_audit(result)
+        self.assertEqual(len(rows), self.PAGES)
+        self.assertEqual(result["success"] + result["failed"], self.PAGES)
+        self.assertEqual(result["failed"], 3)
+        self.assertEqual(self.files_on_disk(self.out), expected)
+        # Repeated names are reserved, not overwritten.
+        self.assertIn(os.path.join("dept0", "Employee_0_2.pdf"), expected)
+
+    def test_small_pdf_is_split_in_process_by_default(self):
+        orig_pool, orig_cpu_count = core.ProcessPoolExecutor, os.cpu_count
+        self.addCleanup(setattr, core, "ProcessPoolExecutor", orig_pool)
+        self.addCleanup(setattr, os, "cpu_count", orig_cpu_count)
+        core.ProcessPoolExecutor = _RecordingPool
+        os.cpu_count = lambda: 4
+        _RecordingPool.created = 0
+        result = self.split(self.out)
+        self.assertEqual(_RecordingPool.created, 0)
+        self.assertEqual(result["success"] + result["failed"], self.PAGES)
+
+    def test_pool_and_in_process_runs_match(self):
+        other = tempfile.TemporaryDirectory()
+        self.addCleanup(other.cleanup)
+        inline = self.split(self.out, max_workers=1)
+        pooled = self.split(other.name, max_workers=2)
+        self.assertEqual(inline["rows"], pooled["rows"])
+        self.assertEqual(self.files_on_disk(self.out), self.files_on_disk(other.name))
+
+    def test_cancel_keeps_named_pages_on_disk(self):
+        cancel = threading.Event()
+
+        def progress(page, total):
+            if page >= 30:
+                cancel.set()
+
+        result = self.split(
+            self.out, max_workers=2, progress_callback=progress, cancel_event=cancel
+        )
+        self.assertTrue(result["cancelled"])
+        rows, expected = self.files_in_audit(result)
+        self.assertEqual(len(rows), 30)
+        self.assertEqual(self.files_on_disk(self.out), expected)
+
+    def test_failed_write_is_not_audited_as_ok(self):
+        orig = core._write_page_chunk
+
+        def fail_after_first_chunk(inp_path, jobs):
+            if jobs[0][0] >= core.SPLIT_CHUNK_PAGES:
+                raise OSError("disk full")
+            return orig(inp_path, jobs)
+
+        core._write_page_chunk = fail_after_first_chunk
+        self.addCleanup(setattr, core, "_write_page_chunk", orig)
+        with self.assertRaises(OSError):
+            self.split(self.out, max_workers=1)
+        (audit_name,) = [n for n in os.listdir(self.out) if n.endswith(".csv")]
+        rows, expected = self.files_in_audit(
+            {"audit_path": os.path.join(self.out, audit_name)}
+        )
+        # The first chunk is saved, the second is logged as not saved, and
+        # the run stops before naming the third.
+        self.assertEqual(len(rows), 2 * core.SPLIT_CHUNK_PAGES)
+        self.assertEqual(len(expected), core.SPLIT_CHUNK_PAGES)
+        self.assertEqual(self.files_on_disk(self.out), expected)
+
+
+@unittest.skipUnless(HAS_PYMUPDF, "PyMuPDF not installed")
+class TestExtractPages(unittest.TestCase):
+    PAGES = 80
+
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.pdf = os.path.join(cls._tmp.name, "payroll.pdf")
+        _make_pdf(cls.pdf, [f"Page {i + 1}" for i in range(cls.PAGES)])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    def setUp(self):
+        self._out = tempfile.TemporaryDirectory()
+        self.out = self._out.name
+
+    def tearDown(self):
+        self._out.cleanup()
+
+    def extract(self, single, r_from, r_to, per_page=False, **kwargs):
+        page_indices, single_page = core.parse_pages(single, r_from, r_to)
+        core.extract_pages(
+            inp_path=self.pdf,
+            out_dir=self.out,
+            page_indices=page_indices,
+            single_page=single_page,
+            per_page=per_page,
+            auto_open=False,
+            **kwargs,
+        )
+        return sorted(os.listdir(self.out))
+
+    def page_text(self, name):
+        with fitz.open(os.path.join(self.out, name)) as doc:
+            return [page.get_text().strip() for page in doc]
+
+    def test_single_page_naming(self):
+        self.assertEqual(self.extract("7", "", ""), ["payroll_page_7.pdf"])
+        self.assertEqual(self.page_text("payroll_page_7.pdf"), ["Page 7"])
+
+    def test_one_page_range_keeps_range_naming(self):
+        self.assertEqual(self.extract("", "3", "3"), ["payroll_pages_3-3.pdf"])
+        self.assertEqual(self.page_text("payroll_pages_3-3.pdf"), ["Page 3"])
+
+    def test_range_into_one_file(self):
+        self.assertEqual(self.extract("", "2", "4"), ["payroll_pages_2-4.pdf"])
+        self.assertEqual(
+            self.page_text("payroll_pages_2-4.pdf"), ["Page 2", "Page 3", "Page 4"]
+        )
+
+    def test_upper_bound_is_checked_against_page_count(self):
+        with self.assertRaisesRegex(ValueError, "Invalid page range."):
+            self.extract("", "3", str(self.PAGES + 1))
+        with self.assertRaisesRegex(ValueError, "Page number out of range."):
+            self.extract(str(self.PAGES + 1), "", "")
+        self.assertEqual(os.listdir(self.out), [])
+
+    def test_per_page_in_process_and_pooled_match(self):
+        expected = sorted(f"payroll_page_{p}.pdf" for p in range(5, 66))
+        for max_workers in (1, 2):
+            with self.subTest(max_workers=max_workers):
+                for name in os.listdir(self.out):
+                    os.remove(os.path.join(self.out, name))
+                files = self.extract(
+                    "", "5", "65", per_page=True, max_workers=max_workers
+                )
+                self.assertEqual(files, expected)
+                self.assertEqual(self.page_text("payroll_page_40.pdf"), ["Page 40"])
+
+    def test_pooled_cancel_stops_before_queued_chunks(self):
+        cancel = threading.Event()
+        reported = []
+
+        def progress(done, total):
+            reported.append(done)
+            cancel.set()
+
+        files = self.extract(
+            "",
+            "1",
+            str(self.PAGES),
+            per_page=True,
+            max_workers=2,
+            progress_callback=progress,
+            cancel_event=cancel,
+        )
+        # Two chunks were in flight when the cancel landed; none after them.
+        self.assertLessEqual(len(files), 2 * core.SPLIT_CHUNK_PAGES)
+        self.assertEqual(len(files), reported[-1])
+
+
+@unittest.skipUnless(HAS_PYMUPDF, "PyMuPDF not installed")
+class TestMergePdfs(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.sources = []
+        for name, pages in [("a", 2), ("b", 40), ("c", 2), ("d", 2)]:
+            path = os.path.join(cls._tmp.name, f"{name}.pdf")
+            _make_pdf(path, [f"{name} {i}" for i in range(pages)])
+            cls.sources.append(path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    def setUp(self):
+        self._out = tempfile.TemporaryDirectory()
+        self.out = self._out.name
+        self._orig_budget = core.MERGE_READ_AHEAD_MAX_BYTES
+        self._orig_read = core._read_merge_source
+
+    def tearDown(self):
+        core.MERGE_READ_AHEAD_MAX_BYTES = self._orig_budget
+        core._read_merge_source = self._orig_read
+        self._out.cleanup()
+
+    def merged_text(self, path):
+        with fitz.open(path) as doc:
+            return [page.get_text().strip() for page in doc]
+
+    def test_buffered_and_by_path_sources_merge_in_order(self):
+        # Room for two small files at once, so "d" waits for "a" to be merged;
+        # "b" is over budget on its own and is opened by path.
+        small = os.path.getsize(self.sources[0])
+        core.MERGE_READ_AHEAD_MAX_BYTES = 2 * small + 1
+        self.assertGreater(os.path.getsize(self.sources[1]), 2 * small + 1)
+        buffered = []
+
+        def read(path):
+            buffered.append(os.path.basename(path))
+            return self._orig_read(path)
+
+        core._read_merge_source = read
+        core.merge_pdfs(self.sources, self.out, "merged", False)
+        self.assertEqual(sorted(buffered), ["a.pdf", "c.pdf", "d.pdf"])
+        expected = [
+            f"{name} {i}"
+            for name, count in [("a", 2), ("b", 40), ("c", 2), ("d", 2)]
+            for i in range(count)
+        ]
+        merged = os.path.join(self.out, "merged.pdf")
+        self.assertEqual(self.merged_text(merged), expected)
+
+    def test_missing_source_raises_friendly_error(self):
+        files = [self.sources[0], os.path.join(self.out, "gone.pdf"), self.sources[2]]
+        with self.assertRaises(core.PdfError) as ctx:
+            core.merge_pdfs(files, self.out, "merged", False)
+        self.assertIn("could not be found", str(ctx.exception))
+        self.assertFalse(os.path.exists(os.path.join(self.out, "merged.pdf")))
+
+    def test_cancel_mid_merge_writes_nothing(self):
+        cancel = threading.Event()
+
+        def progress(done, total):
+            cancel.set()
+
+        core.merge_pdfs(
+            self.sources,
+            self.out,
+            "merged",
+            False,
+            progress_callback=progress,
+            cancel_event=cancel,
+        )
+        self.assertEqual(os.listdir(self.out), [])
+
+
+class TestParsePages(unittest.TestCase):
+    def test_single_page_is_zero_based(self):
+        self.assertEqual(core.parse_pages("5", "", ""), ((4,), True))
+
+    def test_range_is_inclusive(self):
+        self.assertEqual(core.parse_pages("", "2", "4"), ((1, 2, 3), False))
+
+    def test_one_page_range_is_still_a_range(self):
+        self.assertEqual(core.parse_pages("", "3", "3"), ((2,), False))
+
+    def test_single_page_wins_over_range(self):
+        self.assertEqual(core.parse_pages("1", "2", "4"), ((0,), True))
+
+    def test_rejects_bad_input(self):
+        for args in [("0", "", ""), ("x", "", ""), ("", "3", "2"), ("", "0", "2"),
+                     ("", "1", "y"), ("", "", ""), ("", "1", "")]:
+            with self.subTest(args=args):
+                with self.assertRaises(ValueError):
+                    core.parse_pages(*args)
+
 
 class TestMoveItem(unittest.TestCase):
     def test_move_up(self):
@@ -347,6 +809,95 @@ class TestSchemaLoading(unittest.TestCase):
             data = core._read_schema_file(path)
             self.assertEqual(data["file_pattern"], "[LINE 0].pdf")
 
+    def test_load_schema_sees_saved_changes(self):
+        with tempfile.TemporaryDirectory() as d:
+            orig = core.get_schema_folder
+            core.get_schema_folder = lambda: d
+            try:
+                core.save_schema("s", "[LINE 0].pdf", "")
+                self.assertEqual(core.load_schema("s")["file_pattern"], "[LINE 0].pdf")
+                core.save_schema("s", "[LINE 1].pdf", "")
+                self.assertEqual(core.load_schema("s")["file_pattern"], "[LINE 1].pdf")
+                core.delete_schema("s")
+                self.assertIsNone(core.load_schema("s"))
+            finally:
+                core.get_schema_folder = orig
+
+    def test_load_schema_returns_independent_copies(self):
+        with tempfile.TemporaryDirectory() as d:
+            orig = core.get_schema_folder
+            core.get_schema_folder = lambda: d
+            try:
+                core.save_schema("s", "[LINE 0].pdf", "")
+                core.load_schema("s")["file_pattern"] = "changed"
+                self.assertEqual(core.load_schema("s")["file_pattern"], "[LINE 0].pdf")
+            finally:
+                core.get_schema_folder = orig
+
+    def test_list_schemas_skips_non_json_and_folders(self):
+        with tempfile.TemporaryDirectory() as d:
+            for name in ("a.json", "b.txt"):
+                open(os.path.join(d, name), "w").close()
+            os.mkdir(os.path.join(d, "c.json"))
+            orig = core.get_schema_folder
+            core.get_schema_folder = lambda: d
+            try:
+                self.assertEqual(core.list_schemas(), ["a"])
+            finally:
+                core.get_schema_folder = orig
+
+
+class TestAppLog(unittest.TestCase):
+    def setUp(self):
+        core.close_app_log()
+        self._orig_path = core.APP_LOG_PATH
+        self._tmp = tempfile.TemporaryDirectory()
+        core.APP_LOG_PATH = os.path.join(self._tmp.name, "app_log.txt")
+
+    def tearDown(self):
+        core.close_app_log()
+        core.APP_LOG_PATH = self._orig_path
+        self._tmp.cleanup()
+
+    def _read(self):
+        with open(core.APP_LOG_PATH, "r", encoding="utf-8") as f:
+            return f.read()
+
+    def test_lines_reach_disk_on_flush(self):
+        core.write_app_log("first")
+        core.write_app_log("second")
+        core.flush_app_log()
+        content = self._read()
+        self.assertIn("] first\n", content)
+        self.assertIn("] second\n", content)
+
+    def test_error_lines_are_flushed_immediately(self):
+        core.write_app_log("[pdf-open-error] x.pdf: broken")
+        self.assertIn("pdf-open-error", self._read())
+
+
+class TestConfig(unittest.TestCase):
+    def setUp(self):
+        self._orig_path = core.CONFIG_FILE
+        self._tmp = tempfile.TemporaryDirectory()
+        core.CONFIG_FILE = os.path.join(self._tmp.name, "splitpay_config.json")
+
+    def tearDown(self):
+        core.CONFIG_FILE = self._orig_path
+        self._tmp.cleanup()
+
+    def test_save_replaces_config_without_leftovers(self):
+        core.save_config({"theme": "dark"})
+        core.save_config({"theme": "light", "debug": True})
+        self.assertEqual(core.load_config(), {"theme": "light", "debug": True})
+        self.assertEqual(os.listdir(self._tmp.name), ["splitpay_config.json"])
+
+    def test_unserialisable_config_keeps_previous_file(self):
+        core.save_config({"theme": "dark"})
+        core.save_config({"bad": object()})
+        self.assertEqual(core.load_config(), {"theme": "dark"})
+        self.assertEqual(os.listdir(self._tmp.name), ["splitpay_config.json"])
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)